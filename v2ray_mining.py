@@ -11,17 +11,19 @@ is present in ./core_engine (extract archives, search project, set +x, copy/rena
 Designed to run on Linux (Ubuntu) in GitHub Actions.
 """
 
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import aiohttp
 import re
 import sys
 from pathlib import Path
 import json
-import base64
+from binascii import a2b_base64, b2a_base64
+import functools
+import html as html_mod
 from python_v2ray.config_parser import parse_uri
 from python_v2ray.downloader import BinaryDownloader
 from python_v2ray.tester import ConnectionTester
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
 
 # extra imports for robust handling
 import os
@@ -32,36 +34,106 @@ import tarfile
 import fnmatch
 import traceback
 
+# orjson emits compact UTF-8 bytes directly; stdlib json is the fallback and
+# also handles payloads orjson cannot represent exactly (see transform_vmess)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _env_workers(name: str, default: int) -> int:
+    # a bad override falls back to the default instead of failing at import
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        n = int(value)
+    except ValueError:
+        n = 0
+    if n < 1:
+        print(f"[WARN] ignoring {name}={value!r}; using {default}", file=sys.stderr)
+        return default
+    return n
+
 # ---------------- SETTINGS ----------------
 BASE_URL = "https://www.v2nodes.com"
 PAGES_TO_SCRAPE = 5
 REQUEST_TIMEOUT = 12
+# Accept-Encoding is left to aiohttp: it advertises gzip/deflate, plus br when
+# a brotli module is installed, and decompresses responses transparently
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36'
 }
 OUTPUT_FILE = Path("configs.txt")
 SLEEP_BETWEEN_REQUESTS = 0.5  # polite crawling
+# in-flight request caps per phase, overridable from the environment; server
+# pages dominate, so their default scales with the runner's cores
+INDEX_WORKERS = _env_workers('SCRAPE_INDEX_WORKERS', 10)
+SERVER_WORKERS = _env_workers('SCRAPE_SERVER_WORKERS', min(32, (os.cpu_count() or 1) * 4))
+MAX_PAGE_BYTES = 2 * 1024 * 1024  # stop reading a response body past this size
+FETCH_RETRIES = 2  # extra attempts on connection errors, timeouts and 5xx
+RETRY_BACKOFF = 0.3  # seconds, doubled after each failed attempt
+PARSE_POOL_MIN = 5000  # configs needed before parsing moves to a process pool
 # ------------------------------------------
 
+# a possessive quantifier (re on Python 3.11+) lets the matcher drop its
+# backtrack state for the URI body; older interpreters use a plain greedy one
+_POSSESSIVE = '+' if sys.version_info >= (3, 11) else ''
+
+# schemes are spelled out per case instead of using re.IGNORECASE, which
+# case-folds every input character. A scheme may not start mid-word, so an
+# unlisted spelling such as 'vLess://' matches nothing instead of yielding a
+# bogus 'ss://' from its tail. vmess alone stays case-insensitive:
+# transform_vmess re-emits any spelling as 'vmess://', so mixed-case vmess
+# links do reach the output
 URI_RE = re.compile(
-    r'(?:vless|vmess|trojan|ss)://'            # scheme
-    r'[^\s\'"<>()[\]{}]+'                     # body until a breaking char
-    r'(?:#[^\n\r]{0,200})?',                  # optional fragment up to newline (max 200 chars)
-    re.IGNORECASE
+    r'(?<![A-Za-z0-9])'                                                   # no mid-word start
+    r'(?:vless|VLESS|Vless|(?i:vmess)|trojan|TROJAN|Trojan|ss|SS|Ss)://'  # scheme
+    r'[^\s\'"<>()\[\]{}]+' + _POSSESSIVE       # body (and any '#fragment') until a breaking char
 )
 
+A_HREF_RE = re.compile(r'<a[^>]+href="([^"]+)"[^>]*>([^<]*)</a>', re.IGNORECASE | re.DOTALL)
+
 FLAG_RE = re.compile(r'[\U0001F1E6-\U0001F1FF]{2}')
 
+# vmess://<base64 payload>[#fragment]; the fragment is dropped on re-encode
+_VMESS_RE = re.compile(r'^vmess://([^#\s]+)(?:#.*)?\Z', re.IGNORECASE | re.DOTALL)
+
+# '=' padding needed for a base64 payload, indexed by len(payload) % 4
+_B64_PAD = ('', '===', '==', '=')
+
+# server links on index pages, matched straight off the markup instead of
+# parsing a DOM just to read <a href> values. Attributes are consumed whole,
+# so a '>' inside a quoted value does not end the tag and 'data-href' is never
+# split into a bare 'href'; the value may be double-, single- or unquoted.
+# Unquoted names and values stop at '<', so an unclosed tag cannot make the
+# scan run on into the following tags (quadratic on malformed pages)
+_TAG_ATTR = r'''[^\s"'<>/=]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s"'<>]+))?'''
+_SERVER_HREF_RE = re.compile(
+    r'<a(?:\s+' + _TAG_ATTR + r')*?\s+href\s*=\s*'
+    r'''(?:"\s*(/servers/\d+[^"]*?)\s*"|'\s*(/servers/\d+[^']*?)\s*'|(/servers/\d+[^\s>]*))''',
+    re.IGNORECASE)
+
+# parse_uri only accepts lower-case schemes
+_URI_SCHEMES = ('vless://', 'vmess://', 'trojan://', 'ss://')
+
+_CLEAN_RE = re.compile(r'^[\s\'"]+|[\s\'"]+\Z')
+_PAREN_RE = re.compile(r'^\((.*)\)\Z', re.DOTALL)
+_TRAILING_RE = re.compile(r'[.,;:!?)\]"\']+\Z')
+
+@functools.lru_cache(maxsize=16384)
 def clean_uri(uri: str) -> str:
     if not uri:
         return uri
-    uri = uri.strip()
-    uri = uri.strip(' \t\n\r"\'')
-    while uri.startswith('(') and uri.endswith(')'):
-        uri = uri[1:-1].strip()
-    uri = uri.rstrip('.,;:!?)"\']')
-    return uri
-
+    uri = _CLEAN_RE.sub('', uri)
+    # balanced-paren unwrap is the rare path; only loop while it matches
+    m = _PAREN_RE.match(uri)
+    while m:
+        uri = m.group(1).strip()
+        m = _PAREN_RE.match(uri)
+    return _TRAILING_RE.sub('', uri)
+
+@functools.lru_cache(maxsize=16384)
 def extract_flag_from_ps(ps: str) -> str:
     if not ps:
         return ""
@@ -70,22 +142,43 @@ def extract_flag_from_ps(ps: str) -> str:
         return m.group(0)
     return ps.strip()[:4]
 
+def _has_float(obj) -> bool:
+    if isinstance(obj, float):
+        return True
+    if isinstance(obj, dict):
+        return any(_has_float(v) for v in obj.values())
+    if isinstance(obj, list):
+        return any(_has_float(v) for v in obj)
+    return False
+
+@functools.lru_cache(maxsize=8192)
 def transform_vmess(uri: str) -> str:
-    try:
-        prefix, payload = uri.split('://', 1)
-    except ValueError:
-        return uri
-    if prefix.lower() != 'vmess':
+    m = _VMESS_RE.match(uri)
+    if not m:
         return uri
-    payload = payload.strip()
-    if '#' in payload:
-        payload = payload.split('#', 1)[0]
-    missing_padding = len(payload) % 4
-    if missing_padding:
-        payload += '=' * (4 - missing_padding)
+    payload = m.group(1)
+    payload += _B64_PAD[len(payload) & 3]
     try:
-        decoded = base64.b64decode(payload).decode('utf-8', errors='replace')
-        data = json.loads(decoded)
+        raw = a2b_base64(payload)
+        data = None
+        if orjson:
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+            else:
+                # orjson reads integers past 64 bits as floats; any payload
+                # with a float goes through json so numbers round-trip exactly
+                if _has_float(data):
+                    data = None
+        fast = data is not None
+        if not fast:
+            try:
+                # json.loads takes UTF-8 bytes directly, skipping a str copy
+                data = json.loads(raw)
+            except UnicodeDecodeError:
+                # not valid UTF-8: keep accepting it via a lossy decode
+                data = json.loads(raw.decode('utf-8', errors='replace'))
     except Exception:
         return uri
     ps = data.get('ps', '') or ''
@@ -95,153 +188,254 @@ def transform_vmess(uri: str) -> str:
     else:
         data['ps'] = ps.strip()
     try:
-        new_json = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
-        new_b64 = base64.b64encode(new_json.encode('utf-8')).decode('utf-8')
+        if fast:
+            new_json = orjson.dumps(data)
+        else:
+            new_json = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        new_b64 = b2a_base64(new_json, newline=False).decode('ascii')
         return 'vmess://' + new_b64
     except Exception:
         return uri
 
-def extract_configs_from_html(html: str) -> list:
-    found = []
-    for m in URI_RE.findall(html):
-        candidate = clean_uri(m)
-        candidate = transform_vmess(candidate) if candidate.lower().startswith('vmess://') else candidate
-        found.append(candidate)
-
-    soup = BeautifulSoup(html, 'html.parser')
-    for a in soup.find_all('a', href=True):
-        # Use getattr to safely access href attribute
-        href = getattr(a, 'attrs', {}).get('href', '')
-        if href:
-            href = str(href).strip()
-            text = a.get_text(separator=' ', strip=True)
-            m_href = URI_RE.search(href)
-            if m_href:
-                uri = clean_uri(m_href.group(0))
-                if uri.lower().startswith('vmess://'):
-                    uri = transform_vmess(uri)
-                if '#' in text:
-                    idx = text.find('#')
-                    frag = text[idx: idx + 200].split('\n', 1)[0].rstrip('.,;:!?)]"\'')
-                    if '#' in uri:
-                        if len(frag) > len(uri.split('#', 1)[1]):
-                            uri = uri.split('#', 1)[0] + frag
-                    else:
-                        uri = uri + frag
-                found.append(uri)
-                continue
-            if URI_RE.search(text):
-                for m in URI_RE.findall(text):
-                    uri = clean_uri(m)
-                    if uri.lower().startswith('vmess://'):
-                        uri = transform_vmess(uri)
-                    found.append(uri)
-
-    for tagname in ('pre', 'code', 'p', 'li', 'div', 'span'):
-        for node in soup.find_all(tagname):
-            txt = node.get_text(separator=' ', strip=True)
-            if not txt:
-                continue
-            for m in URI_RE.findall(txt):
-                uri = clean_uri(m)
-                if uri.lower().startswith('vmess://'):
-                    uri = transform_vmess(uri)
-                found.append(uri)
-
-    visible_text = soup.get_text(separator=' ', strip=True)
-    for m in URI_RE.findall(visible_text):
+def _prefilter(uri: str) -> bool:
+    # cheap scheme/shape test so parse_uri only sees plausible candidates
+    if not uri.startswith(_URI_SCHEMES):
+        return False
+    if uri.startswith(('vless://', 'trojan://')):
+        # both need user@host:port (trojan's user is its password); the
+        # port's ':' has to come after the '@', not the one in '://'
+        at = uri.find('@')
+        return at > 0 and uri.find(':', at) > 0
+    if uri.startswith('vmess://'):
+        # parse_uri json-decodes the payload the same way and needs an object
+        try:
+            payload = a2b_base64(uri[8:].split('#', 1)[0] + '==')
+        except ValueError:
+            return False
+        return payload.lstrip()[:1] == b'{'
+    return True
+
+def extract_configs_from_html(html: str, seen: set, out: list) -> list:
+    # URI_RE matches anywhere in the document, so one pass over the unescaped
+    # markup finds everything the old per-tag BeautifulSoup walks did
+    # dedup on the raw match so repeats skip cleaning, vmess decode and parse_uri
+    seen_raw = set()
+    found = {}  # uri as found on the page -> uri to validate (ordered)
+    for match in URI_RE.finditer(html_mod.unescape(html)):
+        m = match.group(0)
+        if m in seen_raw:
+            continue
+        seen_raw.add(m)
         uri = clean_uri(m)
-        if uri.lower().startswith('vmess://'):
+        if uri[:8].lower() == 'vmess://':
             uri = transform_vmess(uri)
-        found.append(uri)
-
-    valid_found = []
-    for uri in found:
-        if not uri:
+        found[uri] = uri
+
+    # link text may carry a longer '#name' fragment than the href itself;
+    # merge it into the href's entry rather than keeping both forms
+    seen_links = set()
+    for match in A_HREF_RE.finditer(html):
+        href, text = match.groups()
+        if (href, text) in seen_links:
+            continue
+        seen_links.add((href, text))
+        m_href = URI_RE.search(html_mod.unescape(href))
+        if not m_href:
+            continue
+        text = html_mod.unescape(text).strip()
+        if '#' not in text:
             continue
-        if uri.lower().startswith('vless://') and ('@' not in uri or ':' not in uri):
+        base = clean_uri(m_href.group(0))
+        if base[:8].lower() == 'vmess://':
+            base = transform_vmess(base)
+        uri = found.get(base, base)
+        idx = text.find('#')
+        frag = text[idx: idx + 200].split('\n', 1)[0].split('\r', 1)[0].rstrip('.,;:!?)]"\'')
+        if '#' in uri:
+            if len(frag) > len(uri.split('#', 1)[1]):
+                uri = uri.split('#', 1)[0] + frag
+        else:
+            uri = uri + frag
+        found[base] = uri
+
+    for uri in found.values():
+        if not uri or uri in seen or not _prefilter(uri):
             continue
         try:
             if parse_uri(uri):
-                valid_found.append(uri)
+                seen.add(uri)
+                out.append(uri)
         except Exception:
             pass
-    return valid_found
+    return out
+
+async def read_capped(resp: aiohttp.ClientResponse) -> str:
+    body = bytearray()
+    async for chunk in resp.content.iter_chunked(64 * 1024):
+        body += chunk
+        if len(body) > MAX_PAGE_BYTES:
+            del body[MAX_PAGE_BYTES:]
+            print(f"[WARN] {resp.url} truncated at {MAX_PAGE_BYTES} bytes; later configs are skipped",
+                  file=sys.stderr)
+            break
+    # v2nodes serves UTF-8; ignoring the header's charset also keeps a bogus
+    # label from raising LookupError and losing the page
+    return body.decode('utf-8', errors='replace')
 
-def extract_from_server(server_url: str) -> list:
-    try:
-        resp = requests.get(server_url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
-        resp.raise_for_status()
-        html = resp.text.replace('\r\n', '\n').replace('\r', '\n')
-        return list(dict.fromkeys(extract_configs_from_html(html)))
-    except Exception as e:
-        print(f"[WARN] fetch error {server_url}: {e}", file=sys.stderr)
-        return []
+async def fetch_html(session: aiohttp.ClientSession, url: str) -> str:
+    for attempt in range(FETCH_RETRIES + 1):
+        try:
+            async with session.get(url) as resp:
+                resp.raise_for_status()
+                return await read_capped(resp)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # a 4xx will not fix itself; anything else is worth another try
+            client_error = isinstance(e, aiohttp.ClientResponseError) and e.status < 500
+            if client_error or attempt == FETCH_RETRIES:
+                raise
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+async def fetch_server(session: aiohttp.ClientSession, sem: asyncio.Semaphore, server_url: str) -> list:
+    async with sem:
+        try:
+            html = await fetch_html(session, server_url)
+            # extraction is CPU work: run it in the default thread pool so the
+            # loop keeps servicing sockets; per-task seen/out avoid sharing
+            # mutable state across threads and are merged in scrape()
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, extract_configs_from_html, html, set(), [])
+        except Exception as e:
+            print(f"[WARN] fetch error {server_url}: {e!r}", file=sys.stderr)
+            return []
+        finally:
+            await asyncio.sleep(SLEEP_BETWEEN_REQUESTS)
 
-def scrape(base_url=BASE_URL, pages=PAGES_TO_SCRAPE):
-    def fetch_page(page):
-        page_url = f"{base_url}/?page={page}"
+async def fetch_page(session: aiohttp.ClientSession, sem: asyncio.Semaphore, page_url: str) -> list:
+    async with sem:
         try:
-            resp = requests.get(page_url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, 'html.parser')
+            html = await fetch_html(session, page_url)
             server_links = []
-            for a in soup.find_all('a', href=True):
-                # Use getattr to safely access href attribute
-                href = getattr(a, 'attrs', {}).get('href', '')
-                if href:
-                    href = str(href).strip()
-                    if re.match(r'^/servers/\d+/?', href):
-                        server_links.append(href)
+            for groups in _SERVER_HREF_RE.findall(html):
+                href = groups[0] or groups[1] or groups[2]
+                server_links.append(html_mod.unescape(href) if '&' in href else href)
             return server_links
         except Exception as e:
-            print(f"[WARN] index fetch error {page_url}: {e}", file=sys.stderr)
+            print(f"[WARN] index fetch error {page_url}: {e!r}", file=sys.stderr)
             return []
+        finally:
+            await asyncio.sleep(SLEEP_BETWEEN_REQUESTS)
+
+async def scrape(base_url=BASE_URL, pages=PAGES_TO_SCRAPE):
+    # one session for both phases so keep-alive connections (and their TLS
+    # handshakes) are reused across index and server pages
+    index_slots = max(1, min(INDEX_WORKERS, pages))
+    server_slots = max(1, SERVER_WORKERS)
+    # index and server fetches overlap, so the per-host cap must cover both
+    # semaphores at once; otherwise requests queue in the connector and that
+    # wait counts against ClientTimeout(total=...)
+    per_host = index_slots + server_slots
+    connector = aiohttp.TCPConnector(limit=max(50, per_host), limit_per_host=per_host, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    async with aiohttp.ClientSession(connector=connector, headers=HEADERS, timeout=timeout) as session:
+        print(f"[INFO] scraping {pages} index pages concurrently...")
+        index_sem = asyncio.Semaphore(index_slots)
+        server_sem = asyncio.Semaphore(server_slots)
+        # server fetches start as soon as the index page listing them arrives,
+        # so a slow index page no longer holds up every other page's servers;
+        # all of this runs on the loop thread, so the dict needs no locking
+        server_tasks = {}
+
+        async def crawl_index(page_url):
+            links = await fetch_page(session, index_sem, page_url)
+            for rel in links:
+                if rel not in server_tasks:
+                    server_tasks[rel] = asyncio.ensure_future(
+                        fetch_server(session, server_sem, base_url + rel))
+            return links
+
+        page_results = await asyncio.gather(
+            *(crawl_index(f"{base_url}/?page={page}") for page in range(1, pages + 1))
+        )
 
-    print(f"[INFO] scraping {pages} index pages concurrently...")
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        page_results = list(executor.map(fetch_page, range(1, pages + 1)))
-
-    all_server_links = []
-    for links in page_results:
-        all_server_links.extend(links)
-    all_server_links = list(dict.fromkeys(all_server_links))
-    print(f"[INFO] total unique server links: {len(all_server_links)}")
-
-    def fetch_server(rel):
-        server_url = base_url + rel
-        cfgs = extract_from_server(server_url)
-        return cfgs
+        all_server_links = []
+        for links in page_results:
+            all_server_links.extend(links)
+        all_server_links = list(dict.fromkeys(all_server_links))
+        print(f"[INFO] total unique server links: {len(all_server_links)}")
 
-    print("[INFO] scraping server pages concurrently...")
-    with ThreadPoolExecutor(max_workers=20) as executor:
-        server_results = list(executor.map(fetch_server, all_server_links))
+        print("[INFO] waiting for server pages...")
+        # gathered in link order (not completion order) so output stays stable
+        server_results = await asyncio.gather(*(server_tasks[rel] for rel in all_server_links))
 
     results = []
+    # seen holds references to the same str objects kept in results (and
+    # str caches its hash), so it costs a pointer per config, not a copy
     seen = set()
     for cfgs in server_results:
         for cfg in cfgs:
             if cfg not in seen:
                 seen.add(cfg)
                 results.append(cfg)
-                print(f"    + new: {cfg[:200]}")
+    # one write instead of a print (and pipe flush under Actions) per config
+    sys.stdout.write(''.join(f"    + new: {cfg[:200]}\n" for cfg in results))
+    sys.stdout.flush()
     return results
 
+def _try_parse(uri: str):
+    # module-level so ProcessPoolExecutor can pickle it; returns (uri, parsed)
+    # or None for configs that are filtered out or fail to parse
+    if 'reality' in uri.lower() and 'spx=' not in uri:
+        return None
+    try:
+        p = parse_uri(uri)
+    except Exception:
+        return None
+    return (uri, p) if p else None
+
 def save_configs(configs: list, out_file: Path):
     out_file.parent.mkdir(parents=True, exist_ok=True)
-    text = "\n".join(configs) + ("\n" if configs else "")
     tmp = out_file.with_suffix('.tmp')
-    tmp.write_text(text, encoding='utf-8')
-    tmp.replace(out_file)
+    with open(tmp, 'wb', buffering=1 << 20) as f:
+        f.writelines(c.encode('utf-8') + b'\n' for c in configs)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, out_file)
     print(f"[INFO] saved {len(configs)} configs to {out_file}")
 
 # ---------------- robust tester ensuring for Linux (Ubuntu) ----------------
-def _is_executable_file(p: Path) -> bool:
+# candidate names we expect after extraction or direct download, in priority order
+CANDIDATE_NAMES = (
+    "tester", "core_engine", "core-engine", "coreengine",
+    "core_engine-linux-64", "core_engine_linux_64", "core-engine-linux",
+    "core_engine_linux", "core_engine.exe", "xray", "xray-core", "xray_core"
+)
+# lower-cased file names that look like a tester binary anywhere in the tree
+CANDIDATE_RE = re.compile('|'.join(fnmatch.translate(pat) for pat in ("*core*", "*engine*", "xray*", "tester*")))
+
+def _is_executable_file(p) -> bool:
+    # accepts a Path or an os.DirEntry (whose is_file() uses the cached stat)
     try:
-        return p.is_file() and os.access(str(p), os.X_OK)
+        return p.is_file() and os.access(os.fspath(p), os.X_OK)
     except Exception:
         return False
 
+def _scan(root, depth=None):
+    # os.walk-style top-down listing via os.scandir: yields every DirEntry in
+    # root before descending, recursing at most depth levels (None = no limit);
+    # symlinked directories are not followed and unreadable ones are skipped
+    subdirs = []
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                yield entry
+    except OSError:
+        return
+    if depth is None or depth > 0:
+        for sub in subdirs:
+            yield from _scan(sub, None if depth is None else depth - 1)
+
 def _make_executable(p: Path):
     try:
         mode = p.stat().st_mode
@@ -252,21 +446,54 @@ def _make_executable(p: Path):
         except Exception:
             pass
 
-def _extract_archive(archive_path: Path, dest: Path) -> bool:
+def _link_or_copy(src, dst) -> str:
+    # a hard link moves no bytes, but shares the inode: only link a source
+    # that is already fully executable, so the later chmod cannot change it
+    # (e.g. the git-tracked core_engine/tester, mode 0644). Copy otherwise,
+    # or when linking fails (other filesystem, dst already present, ...).
+    # Returns 'linked' or 'copied' for the log line
+    x_bits = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+    if os.stat(src).st_mode & x_bits == x_bits:
+        try:
+            os.link(src, dst)
+            return 'linked'
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+    return 'copied'
+
+def _extract_archive(archive_path: Path, dest: Path) -> list:
+    # only members that look like the tester (exec bit or candidate name) are
+    # written out; returns the extracted file paths so callers need not rescan
+    extracted = []
     try:
         if zipfile.is_zipfile(archive_path):
             print(f"[INFO] extracting zip {archive_path} -> {dest}")
             with zipfile.ZipFile(archive_path, 'r') as z:
-                z.extractall(dest)
-            return True
-        if tarfile.is_tarfile(archive_path):
+                for info in z.infolist():
+                    if info.is_dir():
+                        continue
+                    mode = (info.external_attr >> 16) & 0o777
+                    if not (mode & 0o111 or CANDIDATE_RE.match(os.path.basename(info.filename).lower())):
+                        continue
+                    path = Path(z.extract(info, dest))
+                    # zipfile drops permission bits; restore the exec bit
+                    if mode & 0o111:
+                        _make_executable(path)
+                    extracted.append(path)
+        elif tarfile.is_tarfile(archive_path):
             print(f"[INFO] extracting tar {archive_path} -> {dest}")
             with tarfile.open(archive_path, 'r:*') as t:
-                t.extractall(dest)
-            return True
+                for member in t.getmembers():
+                    if not member.isfile():
+                        continue
+                    if not (member.mode & 0o111 or CANDIDATE_RE.match(os.path.basename(member.name).lower())):
+                        continue
+                    t.extract(member, dest)
+                    extracted.append(Path(dest) / member.name)
     except Exception as e:
         print(f"[WARN] failed to extract {archive_path}: {e}", file=sys.stderr)
-    return False
+    return extracted
 
 def ensure_tester_executable_linux(project_root: Path, core_engine_dir: Path):
     project_root = Path(project_root).resolve()
@@ -288,21 +515,15 @@ def ensure_tester_executable_linux(project_root: Path, core_engine_dir: Path):
         print(f"[CORE ENGINE] tester already exists and is executable: {expected}")
         return True
 
-    # candidate names we expect after extraction or direct download
-    candidate_names = [
-        "tester", "core_engine", "core-engine", "coreengine",
-        "core_engine-linux-64", "core_engine_linux_64", "core-engine-linux",
-        "core_engine_linux", "core_engine.exe", "xray", "xray-core", "xray_core"
-    ]
-
     # 1) check inside core_engine dir for candidates
-    for name in candidate_names:
+    present = {e.name for e in _scan(core_engine_dir, 0)}
+    for name in CANDIDATE_NAMES:
         p = core_engine_dir / name
-        if p.exists():
+        if name in present:
             try:
-                shutil.copy2(str(p), str(expected))
+                how = _link_or_copy(str(p), str(expected))
                 _make_executable(expected)
-                print(f"[CORE ENGINE] copied candidate {p} -> {expected}")
+                print(f"[CORE ENGINE] {how} candidate {p} -> {expected}")
                 return True
             except Exception as e:
                 print(f"[WARN] failed to copy {p} -> {expected}: {e}", file=sys.stderr)
@@ -310,89 +531,79 @@ def ensure_tester_executable_linux(project_root: Path, core_engine_dir: Path):
     # 2) Check vendor directory for core_engine
     vendor_dir = project_root / "vendor"
     if vendor_dir.exists():
-        for name in candidate_names:
+        present = {e.name for e in _scan(vendor_dir, 0)}
+        for name in CANDIDATE_NAMES:
             vendor_candidate = vendor_dir / name
-            if vendor_candidate.exists():
+            if name in present:
                 try:
-                    shutil.copy2(str(vendor_candidate), str(expected))
+                    how = _link_or_copy(str(vendor_candidate), str(expected))
                     _make_executable(expected)
-                    print(f"[CORE ENGINE] copied vendor/{name} -> {expected}")
+                    print(f"[CORE ENGINE] {how} vendor/{name} -> {expected}")
                     return True
                 except Exception as e:
                     print(f"[WARN] failed to copy vendor/{name}: {e}", file=sys.stderr)
 
     # 3) check for any executable inside core_engine dir
-    if core_engine_dir.exists():
-        for entry in core_engine_dir.iterdir():
-            if _is_executable_file(entry):
+    for entry in _scan(core_engine_dir, 0):
+        if _is_executable_file(entry):
+            try:
+                how = _link_or_copy(entry.path, str(expected))
+                _make_executable(expected)
+                print(f"[CORE ENGINE] {how} executable {entry.path} -> {expected}")
+                return True
+            except Exception as e:
+                print(f"[WARN] failed to copy {entry.path} -> {expected}: {e}", file=sys.stderr)
+
+    # 4) if there are archives inside core_engine (zip/tar), try extracting them in-place then search again
+    archives = [e.path for e in _scan(core_engine_dir, 0)
+                if e.is_file() and e.name.lower().endswith(('.zip', '.gz', '.tgz', '.tar'))]
+    for archive in archives:
+        print(f"[CORE ENGINE] found archive inside core_engine: {archive}, trying extract")
+        for sub in _extract_archive(Path(archive), core_engine_dir):
+            if _is_executable_file(sub):
                 try:
-                    shutil.copy2(str(entry), str(expected))
+                    how = _link_or_copy(str(sub), str(expected))
                     _make_executable(expected)
-                    print(f"[CORE ENGINE] copied executable {entry} -> {expected}")
+                    print(f"[CORE ENGINE] extracted and {how} {sub} -> {expected}")
                     return True
                 except Exception as e:
-                    print(f"[WARN] failed to copy {entry} -> {expected}: {e}", file=sys.stderr)
-
-    # 4) if there are archives inside core_engine (zip/tar), try extracting them in-place then search again
-    if core_engine_dir.exists():
-        for entry in core_engine_dir.iterdir():
-            if entry.is_file() and entry.suffix.lower() in ('.zip', '.gz', '.tgz', '.tar'):
-                print(f"[CORE ENGINE] found archive inside core_engine: {entry}, trying extract")
-                if _extract_archive(entry, core_engine_dir):
-                    # attempt to find executables again
-                    for sub in core_engine_dir.rglob("*"):
-                        if _is_executable_file(sub):
-                            try:
-                                shutil.copy2(str(sub), str(expected))
-                                _make_executable(expected)
-                                print(f"[CORE ENGINE] extracted and copied {sub} -> {expected}")
-                                return True
-                            except Exception as e:
-                                print(f"[WARN] failed to copy extracted {sub}: {e}", file=sys.stderr)
+                    print(f"[WARN] failed to copy extracted {sub}: {e}", file=sys.stderr)
 
     # 5) Deep search project_root (depth limited) for candidate files or archives
     print("[CORE ENGINE] deep searching project tree for candidates or archives (depth <= 4)...")
     max_depth = 4
     found_archive = None
     found_candidate = None
-    for root, dirs, files in os.walk(str(project_root)):
-        # compute depth
-        rel = Path(root).relative_to(project_root)
-        if len(rel.parts) > max_depth:
-            dirs[:] = []
+    for entry in _scan(project_root, max_depth):
+        if not entry.is_file():
             continue
-        for fname in files:
-            lower = fname.lower()
-            full = Path(root) / fname
-            # archive candidate
-            if lower.endswith(('.zip', '.tar.gz', '.tgz', '.tar')):
-                print(f"[CORE ENGINE] found archive: {full}")
-                # try extract into core_engine_dir
-                if _extract_archive(full, core_engine_dir):
-                    # after extraction try to find executables
-                    for sub in core_engine_dir.rglob("*"):
-                        if _is_executable_file(sub):
-                            try:
-                                shutil.copy2(str(sub), str(expected))
-                                _make_executable(expected)
-                                print(f"[CORE ENGINE] extracted archive and copied {sub} -> {expected}")
-                                return True
-                            except Exception as e:
-                                print(f"[WARN] failed to copy after extract {sub}: {e}", file=sys.stderr)
-                found_archive = full
-            # binary candidate by name patterns
-            if any(fnmatch.fnmatch(lower, pat) for pat in ("*core*", "*engine*", "xray*", "tester*")):
-                print(f"[CORE ENGINE] found candidate file anywhere: {full}")
-                found_candidate = full
-                break
-        if found_candidate:
+        lower = entry.name.lower()
+        full = Path(entry.path)
+        # archive candidate
+        if lower.endswith(('.zip', '.tar.gz', '.tgz', '.tar')):
+            print(f"[CORE ENGINE] found archive: {full}")
+            # try extract into core_engine_dir
+            for sub in _extract_archive(full, core_engine_dir):
+                if _is_executable_file(sub):
+                    try:
+                        how = _link_or_copy(str(sub), str(expected))
+                        _make_executable(expected)
+                        print(f"[CORE ENGINE] extracted archive and {how} {sub} -> {expected}")
+                        return True
+                    except Exception as e:
+                        print(f"[WARN] failed to copy after extract {sub}: {e}", file=sys.stderr)
+            found_archive = full
+        # binary candidate by name patterns
+        if CANDIDATE_RE.match(lower):
+            print(f"[CORE ENGINE] found candidate file anywhere: {full}")
+            found_candidate = full
             break
 
     if found_candidate:
         try:
-            shutil.copy2(str(found_candidate), str(expected))
+            how = _link_or_copy(str(found_candidate), str(expected))
             _make_executable(expected)
-            print(f"[CORE ENGINE] copied found candidate {found_candidate} -> {expected}")
+            print(f"[CORE ENGINE] {how} found candidate {found_candidate} -> {expected}")
             return True
         except Exception as e:
             print(f"[WARN] failed to copy found candidate {found_candidate}: {e}", file=sys.stderr)
@@ -402,48 +613,46 @@ def ensure_tester_executable_linux(project_root: Path, core_engine_dir: Path):
         tmpdir = core_engine_dir / "tmp_extracted"
         tmpdir.mkdir(parents=True, exist_ok=True)
         print(f"[CORE ENGINE] fallback: extracting {found_archive} into tmp {tmpdir}")
-        if _extract_archive(found_archive, tmpdir):
-            for sub in tmpdir.rglob("*"):
-                if _is_executable_file(sub):
-                    try:
-                        shutil.copy2(str(sub), str(expected))
-                        _make_executable(expected)
-                        print(f"[CORE ENGINE] copied executable from tmp {sub} -> {expected}")
-                        return True
-                    except Exception as e:
-                        print(f"[WARN] failed to copy from tmp {sub}: {e}", file=sys.stderr)
-
-    # Last resort: try to find any core_engine* file in the project
-    for root, dirs, files in os.walk(str(project_root)):
-        for fname in files:
-            if "core_engine" in fname.lower() or "tester" in fname.lower():
-                full_path = Path(root) / fname
+        for sub in _extract_archive(found_archive, tmpdir):
+            if _is_executable_file(sub):
                 try:
-                    shutil.copy2(str(full_path), str(expected))
+                    how = _link_or_copy(str(sub), str(expected))
                     _make_executable(expected)
-                    print(f"[CORE ENGINE] copied {full_path} -> {expected}")
+                    print(f"[CORE ENGINE] {how} executable from tmp {sub} -> {expected}")
                     return True
                 except Exception as e:
-                    print(f"[WARN] failed to copy {full_path}: {e}", file=sys.stderr)
+                    print(f"[WARN] failed to copy from tmp {sub}: {e}", file=sys.stderr)
+
+    # Last resort: try to find any core_engine* file in the project
+    for entry in _scan(project_root):
+        lower = entry.name.lower()
+        if ("core_engine" in lower or "tester" in lower) and entry.is_file():
+            try:
+                how = _link_or_copy(entry.path, str(expected))
+                _make_executable(expected)
+                print(f"[CORE ENGINE] {how} {entry.path} -> {expected}")
+                return True
+            except Exception as e:
+                print(f"[WARN] failed to copy {entry.path}: {e}", file=sys.stderr)
 
     # nothing worked - print helpful debug info
     print("[CORE ENGINE] DEBUG: Could not find tester executable. Listing relevant dirs:")
     try:
         print("Project root top-level:")
-        for p in project_root.iterdir():
-            print(" -", p, "(dir)" if p.is_dir() else "(file)")
+        for entry in _scan(project_root, 0):
+            print(" -", entry.path, "(dir)" if entry.is_dir() else "(file)")
     except Exception:
         pass
     try:
         print("core_engine contents:")
         if core_engine_dir.exists():
-            for p in core_engine_dir.rglob("*"):
+            for entry in _scan(core_engine_dir):
                 try:
-                    st = p.stat()
-                    flags = "x" if os.access(str(p), os.X_OK) else "-"
-                    print(f" - {p} ({'dir' if p.is_dir() else 'file'}) size={st.st_size} exec={flags}")
+                    st = entry.stat()
+                    flags = "x" if os.access(entry.path, os.X_OK) else "-"
+                    print(f" - {entry.path} ({'dir' if entry.is_dir() else 'file'}) size={st.st_size} exec={flags}")
                 except Exception:
-                    print(" -", p)
+                    print(" -", entry.path)
         else:
             print(" core_engine does not exist")
     except Exception:
@@ -455,17 +664,16 @@ def ensure_tester_executable_linux(project_root: Path, core_engine_dir: Path):
         import python_v2ray
         pkg_dir = Path(python_v2ray.__file__).parent
         print(f"[CORE ENGINE] Looking in python_v2ray package: {pkg_dir}")
-        for root, dirs, files in os.walk(str(pkg_dir)):
-            for fname in files:
-                if "core_engine" in fname.lower() or "tester" in fname.lower():
-                    full_path = Path(root) / fname
-                    try:
-                        shutil.copy2(str(full_path), str(expected))
-                        _make_executable(expected)
-                        print(f"[CORE ENGINE] copied from package {full_path} -> {expected}")
-                        return True
-                    except Exception as e:
-                        print(f"[WARN] failed to copy from package {full_path}: {e}", file=sys.stderr)
+        for entry in _scan(pkg_dir):
+            lower = entry.name.lower()
+            if ("core_engine" in lower or "tester" in lower) and entry.is_file():
+                try:
+                    shutil.copy2(entry.path, str(expected))
+                    _make_executable(expected)
+                    print(f"[CORE ENGINE] copied from package {entry.path} -> {expected}")
+                    return True
+                except Exception as e:
+                    print(f"[WARN] failed to copy from package {entry.path}: {e}", file=sys.stderr)
     except Exception as e:
         print(f"[WARN] Could not search python_v2ray package: {e}", file=sys.stderr)
 
@@ -497,7 +705,7 @@ echo "[]"
 # -------------------------------------------------------------------
 
 if __name__ == "__main__":
-    configs = scrape()
+    configs = asyncio.run(scrape())
     if not configs:
         print("No configs found from scraping.")
         exit(0)
@@ -527,22 +735,25 @@ if __name__ == "__main__":
         exit(0)
 
     print("\n* Parsing URIs...")
+    # parse_uri costs ~20-30us per URI, less than pool startup plus pickling
+    # each URI and result across; only large batches on multi-core runners
+    # come out ahead, so typical runs parse in-process
+    workers = os.cpu_count() or 1
+    if workers > 1 and len(configs) >= PARSE_POOL_MIN:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = [r for r in pool.map(_try_parse, configs, chunksize=64) if r]
+    else:
+        parsed = [r for r in map(_try_parse, configs) if r]
     parsed_configs = []
     valid_uris = []
-    for uri in configs:
-        if 'reality' in uri.lower() and 'spx=' not in uri:
-            continue
-        try:
-            p = parse_uri(uri)
-            if p:
-                if hasattr(p, 'tag'):
-                    p.tag = f"config_{len(parsed_configs)}"
-                elif isinstance(p, dict) and 'tag' in p:
-                    p['tag'] = f"config_{len(parsed_configs)}"
-                parsed_configs.append(p)
-                valid_uris.append(uri)
-        except Exception:
-            pass
+    # tags number the surviving configs in order, so assign them here
+    for uri, p in parsed:
+        if hasattr(p, 'tag'):
+            p.tag = f"config_{len(parsed_configs)}"
+        elif isinstance(p, dict) and 'tag' in p:
+            p['tag'] = f"config_{len(parsed_configs)}"
+        parsed_configs.append(p)
+        valid_uris.append(uri)
     if not parsed_configs:
         print("No valid configurations found after parsing.")
         exit(0)